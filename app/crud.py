@@ -1,14 +1,38 @@
+import asyncio
+import hashlib
+
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from fastapi import HTTPException, status
 from .models import AnalyzedString
-from .utils import analyze_string
+from .utils import analyze_string, _signed64
 from .schemas import StringCreate
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, literal, delete
 from typing import Optional, Dict, Any, Tuple, List
 
 
+# Columns the API exposes; read paths select exactly these and return
+# plain row mappings, skipping ORM hydration (identity map, attribute
+# instrumentation) that the response building never needed
+_RESPONSE_COLUMNS = (
+    AnalyzedString.id,
+    AnalyzedString.value,
+    AnalyzedString.length,
+    AnalyzedString.is_palindrome,
+    AnalyzedString.unique_characters,
+    AnalyzedString.word_count,
+    AnalyzedString.sha256_hash,
+    AnalyzedString.character_frequency_map,
+    AnalyzedString.created_at,
+)
+
+# Upper bound for POST /strings/bulk; keeps the analysis loop and the
+# multi-VALUES INSERT bounded per request
+MAX_BULK_SIZE = 1000
+
+
 async def create_analyzed_string(db: AsyncSession, string_data: StringCreate):
     try:
         if not hasattr(string_data, 'value') or not isinstance(string_data.value, str) or not string_data.value.strip():
@@ -18,11 +42,18 @@ async def create_analyzed_string(db: AsyncSession, string_data: StringCreate):
             )
 
         value = string_data.value.strip()
-        analysis = analyze_string(value)
+        # CPU-bound; run in a worker thread so concurrent requests don't
+        # serialize behind a long string's hashing and counting
+        analysis = await asyncio.to_thread(analyze_string, value)
 
-        # Check for duplicate
-        existing = await get_string_by_sha256(db, analysis["sha256_hash"])
-        if existing:
+        # Check for duplicate with SELECT 1 ... LIMIT 1 -- no point
+        # fetching and hydrating the whole row just to raise a 409
+        duplicate = await db.scalar(
+            select(literal(1))
+            .where(AnalyzedString.sha256_hash == analysis["sha256_hash"])
+            .limit(1)
+        )
+        if duplicate:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="String already exists in the system"
@@ -37,15 +68,25 @@ async def create_analyzed_string(db: AsyncSession, string_data: StringCreate):
             word_count=analysis["word_count"],
             sha256_hash=analysis["sha256_hash"],
             character_frequency_map=analysis["character_frequency_map"],
+            char_bitmap_lo=analysis["char_bitmap_lo"],
+            char_bitmap_hi=analysis["char_bitmap_hi"],
         )
 
         db.add(new_string)
         await db.commit()
-        await db.refresh(new_string)
         return new_string
 
     except HTTPException:
         raise
+    except IntegrityError:
+        # A concurrent insert can slip between the SELECT 1 pre-check and
+        # the commit; the unique constraint catches it, and it must be a
+        # 409 like any other duplicate, not a 500
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="String already exists in the system"
+        )
     except Exception as e:
         await db.rollback()
         raise HTTPException(
@@ -53,15 +94,95 @@ async def create_analyzed_string(db: AsyncSession, string_data: StringCreate):
             detail=f"Error creating string: {str(e)}"
         )
 
-async def get_string_by_sha256(db: AsyncSession, sha256_hash: str) -> Optional[AnalyzedString]:
-    """Helper function to get a string by its SHA-256 hash."""
+async def create_many_analyzed_strings(db: AsyncSession, strings: List[StringCreate]) -> Dict[str, int]:
+    """
+    Analyze and insert a batch of strings with a single INSERT and commit.
+
+    Duplicates -- within the batch or against existing rows -- are
+    skipped via ON CONFLICT DO NOTHING on the sha256_hash unique index,
+    so one statement replaces the per-string check/insert/commit cycle.
+    """
+    try:
+        if not strings:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Invalid input. Provide at least one non-empty string."
+            )
+
+        if len(strings) > MAX_BULK_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Batch too large. At most {MAX_BULK_SIZE} strings per request."
+            )
+
+        # Reject invalid entries outright, like the single-string path,
+        # so the reported counts only ever cover analyzed strings
+        values = []
+        for string_data in strings:
+            if not isinstance(string_data.value, str) or not string_data.value.strip():
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail="Invalid input. 'value' must be a non-empty string."
+                )
+            values.append(string_data.value.strip())
+
+        # The analysis loop is CPU-bound; run the whole batch in a worker
+        # thread so the event loop keeps serving other requests
+        analyses = await asyncio.to_thread(
+            lambda: [analyze_string(v) for v in values]
+        )
+
+        rows = []
+        seen = set()
+        for value, analysis in zip(values, analyses):
+            sha = analysis["sha256_hash"]
+            if sha in seen:
+                continue
+            seen.add(sha)
+            rows.append({
+                "id": sha,
+                "value": value,
+                "length": analysis["length"],
+                "is_palindrome": analysis["is_palindrome"],
+                "unique_characters": analysis["unique_characters"],
+                "word_count": analysis["word_count"],
+                "sha256_hash": sha,
+                "character_frequency_map": analysis["character_frequency_map"],
+                "char_bitmap_lo": analysis["char_bitmap_lo"],
+                "char_bitmap_hi": analysis["char_bitmap_hi"],
+            })
+
+        stmt = pg_insert(AnalyzedString).values(rows).on_conflict_do_nothing(
+            index_elements=['sha256_hash']
+        )
+        result = await db.execute(stmt)
+        await db.commit()
+
+        inserted = result.rowcount or 0
+        return {
+            "requested": len(strings),
+            "inserted": inserted,
+            "duplicates": len(strings) - inserted
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error creating strings: {str(e)}"
+        )
+
+async def get_string_by_sha256(db: AsyncSession, sha256_hash: str) -> Optional[Dict[str, Any]]:
+    """Helper function to get a string row by its SHA-256 hash."""
     result = await db.execute(
-        select(AnalyzedString).where(AnalyzedString.sha256_hash == sha256_hash)
+        select(*_RESPONSE_COLUMNS).where(AnalyzedString.sha256_hash == sha256_hash)
     )
-    return result.scalar_one_or_none()
+    return result.mappings().one_or_none()
 
-async def get_string_by_value(db: AsyncSession, value: str) -> AnalyzedString:
-    """Get a string by its exact value."""
+async def get_string_by_value(db: AsyncSession, value: str) -> Dict[str, Any]:
+    """Get a string by its exact value as a plain column mapping."""
     if not value or not isinstance(value, str):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -69,10 +190,14 @@ async def get_string_by_value(db: AsyncSession, value: str) -> AnalyzedString:
         )
 
     try:
-        result = await db.execute(
-            select(AnalyzedString).where(AnalyzedString.value == value)
-        )
-        string = result.scalar_one_or_none()
+        # Look up by the hash instead of comparing against the value
+        # column directly: the sha256_hash index entries are fixed-width,
+        # so long values never bloat the comparison or the index walk.
+        # Hashing the value as given preserves the old exact-match
+        # semantics (stored values are stripped at creation time, so only
+        # an already-stripped lookup value can match either way).
+        sha256_hash = hashlib.sha256(value.encode('utf-8')).hexdigest()
+        string = await get_string_by_sha256(db, sha256_hash)
         
         if not string:
             raise HTTPException(
@@ -98,11 +223,12 @@ async def filter_strings(
     contains_character: Optional[str] = None,
     limit: int = 100,
     offset: int = 0
-) -> Tuple[List[AnalyzedString], Dict[str, Any]]:
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
     """
     Filter strings based on various criteria.
     
-    Returns a tuple of (records, applied_filters)
+    Returns a tuple of (records, applied_filters); records are plain
+    column mappings, not ORM objects.
     """
     try:
         # Validate input parameters
@@ -131,7 +257,7 @@ async def filter_strings(
             )
 
         # Build query
-        query = select(AnalyzedString)
+        query = select(*_RESPONSE_COLUMNS)
         filters = []
         
         if is_palindrome is not None:
@@ -147,7 +273,21 @@ async def filter_strings(
             filters.append(AnalyzedString.word_count == word_count)
             
         if contains_character is not None:
-            filters.append(AnalyzedString.value.ilike(f'%{contains_character}%'))
+            # Test the precomputed character-presence bitmap instead of a
+            # leading-wildcard ILIKE, which cannot use an index; fall back
+            # to ILIKE for characters not covered by the bitmap. Note that
+            # lowercasing can expand a single character to several code
+            # points (e.g. 'İ' -> 'i̇'), so check the length before ord()
+            lowered = contains_character.lower()
+            code = ord(lowered) if len(lowered) == 1 else 128
+            if code < 64:
+                mask = _signed64(1 << code)
+                filters.append(AnalyzedString.char_bitmap_lo.op('&')(mask) != 0)
+            elif code < 128:
+                mask = _signed64(1 << (code - 64))
+                filters.append(AnalyzedString.char_bitmap_hi.op('&')(mask) != 0)
+            else:
+                filters.append(AnalyzedString.value.ilike(f'%{contains_character}%'))
         
         # Apply filters if any
         if filters:
@@ -156,9 +296,10 @@ async def filter_strings(
         # Add pagination
         query = query.offset(offset).limit(limit)
         
-        # Execute query
-        result = await db.execute(query)
-        records = result.scalars().all()
+        # Execute query, streaming with a server-side cursor so a large
+        # page never materializes in the driver buffer all at once
+        result = await db.stream(query.execution_options(yield_per=500))
+        records = [dict(record) async for record in result.mappings()]
         
         # Prepare filters_applied dictionary
         filters_applied = {
@@ -190,20 +331,21 @@ async def delete_string_by_value(db: AsyncSession, value: str) -> None:
                 detail="Invalid string value"
             )
             
-        # Find the string
+        # Delete and detect the 404 case in one round trip: RETURNING
+        # yields the deleted id, or nothing if no row matched
         result = await db.execute(
-            select(AnalyzedString).where(AnalyzedString.value == value)
+            delete(AnalyzedString)
+            .where(AnalyzedString.value == value)
+            .returning(AnalyzedString.id)
         )
-        string = result.scalar_one_or_none()
+        deleted_id = result.scalar_one_or_none()
         
-        if not string:
+        if deleted_id is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="String not found."
             )
             
-        # Delete the string
-        await db.delete(string)
         await db.commit()
         
     except HTTPException:
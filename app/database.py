@@ -17,11 +17,14 @@ if not DATABASE_URL:
 
 engine = create_async_engine(
     DATABASE_URL,
-    echo=True,  # Set to False in production
-    pool_size=5,
-    max_overflow=10,
+    # Statement logging is a real CPU cost per query; opt in via env var
+    echo=os.getenv("SQL_ECHO", "").lower() in ("1", "true", "yes"),
+    pool_size=20,
+    max_overflow=40,
     pool_timeout=30,
-    pool_recycle=1800
+    pool_recycle=1800,
+    pool_pre_ping=True,  # avoid handing out stale connections
+    pool_use_lifo=True   # reuse the hottest connections first
 )
 
 SessionLocal = async_sessionmaker(
@@ -34,13 +37,15 @@ SessionLocal = async_sessionmaker(
 Base = declarative_base()
 
 async def get_db():
-    """Dependency for getting async DB session."""
+    """Dependency for getting async DB session.
+
+    Write paths commit inside the CRUD functions; committing here as
+    well would issue a redundant COMMIT on every request, including
+    read-only ones.
+    """
     async with SessionLocal() as session:
         try:
             yield session
-            await session.commit()
         except Exception:
             await session.rollback()
-            raise
-        finally:
-            await session.close()
\ No newline at end of file
+            raise
\ No newline at end of file
@@ -1,3 +1,4 @@
+import functools
 import re
 from typing import Dict, Any, Optional
 
@@ -12,18 +13,30 @@ NUMBER_WORDS = {
     "hundred": 100, "thousand": 1000
 }
 
-# Common patterns for natural language queries
-PATTERNS = {
-    'palindrome': r'(palindromic|palindrome)',
-    'word_count': r'(\d+)\s*(?:word|words?)|(?:single|one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve|thirteen|fourteen|fifteen|sixteen|seventeen|eighteen|nineteen|twenty)\s+words?',
-    'length_gt': r'(?:longer|greater|more)\s+than\s+(\d+)',
-    'length_lt': r'(?:shorter|less)\s+than\s+(\d+)',
-    'length_eq': r'(?:exactly|precisely|of)\s+(\d+)\s+(?:characters?|letters?)',
-    'contains_char': r'(?:containing?|with|that has|having|includes?)\s+(?:the\s+)?(?:letter\s+)?([a-zA-Z])',
-    'vowel': r'[aeiou]',
-    'first_vowel': r'first\s+vowel',
-    'last_vowel': r'last\s+vowel'
-}
+# All query features fused into one alternation so a single finditer
+# pass over the query replaces one re.search per feature. Every
+# alternative is a zero-width lookahead: matches consume no text, so
+# overlapping features (e.g. "with exactly 5 characters" hitting both
+# contains_char and length_eq) are still all detected, exactly as the
+# independent searches did.
+_FUSED_RE = re.compile(
+    r'(?=(?P<palindrome>palindromic|palindrome))'
+    r'|(?=(?P<length_gt>(?:longer|greater|more)\s+than\s+(?P<gt_num>\d+)))'
+    r'|(?=(?P<length_lt>(?:shorter|less)\s+than\s+(?P<lt_num>\d+)))'
+    r'|(?=(?P<length_eq>(?:exactly|precisely|of)\s+(?P<eq_num>\d+)\s+(?:characters?|letters?)))'
+    r'|(?=(?P<word_count>\d+\s*(?:word|words?)|(?:single|one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve|thirteen|fourteen|fifteen|sixteen|seventeen|eighteen|nineteen|twenty)\s+words?))'
+    r'|(?=(?P<contains_char>(?:containing?|with|that has|having|includes?)\s+(?:the\s+)?(?:letter\s+)?(?P<char>[a-zA-Z])))'
+    r'|(?=(?P<first_vowel>first\s+vowel))'
+    r'|(?=(?P<last_vowel>last\s+vowel))'
+)
+
+# Feature names in _FUSED_RE, in alternation order
+_FEATURES = (
+    'palindrome', 'length_gt', 'length_lt', 'length_eq',
+    'word_count', 'contains_char', 'first_vowel', 'last_vowel'
+)
+
+_DIGITS_RE = re.compile(r'\d+')
 
 def text_to_number(text: str) -> int:
     """Convert text representation of numbers to integers."""
@@ -54,7 +67,7 @@ def text_to_number(text: str) -> int:
 def extract_number(text: str) -> Optional[int]:
     """Extract the first number from text."""
     # Look for digits first
-    match = re.search(r'\d+', text)
+    match = _DIGITS_RE.search(text)
     if match:
         return int(match.group(0))
     
@@ -81,47 +94,55 @@ def parse_natural_language(query: str) -> Dict[str, Any]:
     """
     if not query or not isinstance(query, str):
         raise ValueError("Query must be a non-empty string")
-    
+
+    # Users re-issue the same natural-language queries; cache the parse
+    # and hand back a copy so the cached dict stays pristine
+    return dict(_parse_cached(query))
+
+@functools.lru_cache(maxsize=1024)
+def _parse_cached(query: str) -> Dict[str, Any]:
     query = query.lower().strip()
     filters = {}
     
     try:
+        # Single pass: record the first match of each feature
+        found = {}
+        for m in _FUSED_RE.finditer(query):
+            for name in _FEATURES:
+                if name not in found and m.group(name) is not None:
+                    found[name] = m
+                    break
+        
         # Check for palindrome
-        if re.search(PATTERNS['palindrome'], query):
+        if 'palindrome' in found:
             filters["is_palindrome"] = True
         
         # Check for word count
-        word_count_match = re.search(PATTERNS['word_count'], query)
-        if word_count_match:
-            num = extract_number(word_count_match.group(0))
+        if 'word_count' in found:
+            num = extract_number(found['word_count'].group('word_count'))
             if num is not None:
                 filters["word_count"] = num
         
-        # Check for length constraints
-        length_gt = re.search(PATTERNS['length_gt'], query)
-        if length_gt:
-            filters["min_length"] = int(length_gt.group(1)) + 1
+        # Check for length constraints (exact length wins over bounds)
+        if 'length_gt' in found:
+            filters["min_length"] = int(found['length_gt'].group('gt_num')) + 1
         
-        length_lt = re.search(PATTERNS['length_lt'], query)
-        if length_lt:
-            filters["max_length"] = int(length_lt.group(1)) - 1
+        if 'length_lt' in found:
+            filters["max_length"] = int(found['length_lt'].group('lt_num')) - 1
         
-        length_eq = re.search(PATTERNS['length_eq'], query)
-        if length_eq:
-            length = int(length_eq.group(1))
+        if 'length_eq' in found:
+            length = int(found['length_eq'].group('eq_num'))
             filters["min_length"] = length
             filters["max_length"] = length
         
         # Check for character containment
-        char_match = re.search(PATTERNS['contains_char'], query)
-        if char_match:
-            char = char_match.group(1).lower()
-            filters["contains_character"] = char
+        if 'contains_char' in found:
+            filters["contains_character"] = found['contains_char'].group('char').lower()
         
         # Special case for first/last vowel
-        if re.search(PATTERNS['first_vowel'], query):
+        if 'first_vowel' in found:
             filters["contains_character"] = 'a'  # Default to 'a' as first vowel
-        elif re.search(PATTERNS['last_vowel'], query):
+        elif 'last_vowel' in found:
             filters["contains_character"] = 'u'  # Default to 'u' as last vowel
         
         # If no filters were applied, raise an error
@@ -132,25 +153,3 @@ def parse_natural_language(query: str) -> Dict[str, Any]:
     
     except Exception as e:
         raise ValueError(f"Error parsing query: {str(e)}")
-    if match:
-        filters["max_length"] = int(match.group(1)) - 1
-
-    match = re.search(r"exactly (\d+) words?", q)
-    if match:
-        filters["word_count"] = int(match.group(1))
-
-    match = re.search(r"containing the letter (\w)", q)
-    if match:
-        filters["contains_character"] = match.group(1)
-
-    match = re.search(r"containing the character (\w)", q)
-    if match:
-        filters["contains_character"] = match.group(1)
-
-    if "first vowel" in q:
-        filters["contains_character"] = "a"  # naive heuristic
-
-    if not filters:
-        raise ValueError("Unable to parse natural language query.")
-
-    return filters
@@ -1,5 +1,5 @@
 from fastapi import FastAPI, Depends, status, Query, Response, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from typing import List, Optional, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -13,7 +13,25 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+# orjson serializes from C (with native datetime support), a large win
+# for the frequency-map-heavy list responses
+app = FastAPI(default_response_class=ORJSONResponse)
+
+def serialize_string_row(row) -> Dict[str, Any]:
+    """Shape a read-path row mapping into the API response structure."""
+    return {
+        "id": row["id"],
+        "value": row["value"],
+        "properties": {
+            "length": row["length"],
+            "is_palindrome": row["is_palindrome"],
+            "unique_characters": row["unique_characters"],
+            "word_count": row["word_count"],
+            "sha256_hash": row["sha256_hash"],
+            "character_frequency_map": row["character_frequency_map"],
+        },
+        "created_at": row["created_at"]
+    }
 
 # Add CORS middleware
 app.add_middleware(
@@ -76,6 +94,16 @@ async def analyze_string(payload: schemas.StringCreate, db: AsyncSession = Depen
         logger.error(f"Error creating string: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@app.post("/strings/bulk", status_code=status.HTTP_201_CREATED)
+async def analyze_strings_bulk(payload: List[schemas.StringCreate], db: AsyncSession = Depends(get_db)):
+    try:
+        return await crud.create_many_analyzed_strings(db, payload)
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        logger.error(f"Error creating strings in bulk: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
 @app.get("/strings/filter-by-natural-language")
 async def filter_by_natural_language(query: str, db: AsyncSession = Depends(get_db)):
     try:
@@ -92,21 +120,7 @@ async def filter_by_natural_language(query: str, db: AsyncSession = Depends(get_
         contains_character=parsed_filters.get("contains_character"),
     )
 
-    data = []
-    for s in strings:
-        data.append({
-            "id": s.id,
-            "value": s.value,
-            "properties": {
-                "length": s.length,
-                "is_palindrome": s.is_palindrome,
-                "unique_characters": s.unique_characters,
-                "word_count": s.word_count,
-                "sha256_hash": s.sha256_hash,
-                "character_frequency_map": s.character_frequency_map,
-            },
-            "created_at": s.created_at
-        })
+    data = [serialize_string_row(s) for s in strings]
 
     # Return even if data is empty
     return {
@@ -125,19 +139,7 @@ async def get_string(value: str, db: AsyncSession = Depends(get_db)):
     
     try:
         string = await crud.get_string_by_value(db, value)
-        return {
-            "id": string.id,
-            "value": string.value,
-            "properties": {
-                "length": string.length,
-                "is_palindrome": string.is_palindrome,
-                "unique_characters": string.unique_characters,
-                "word_count": string.word_count,
-                "sha256_hash": string.sha256_hash,
-                "character_frequency_map": string.character_frequency_map,
-            },
-            "created_at": string.created_at
-        }
+        return serialize_string_row(string)
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -151,6 +153,8 @@ async def get_filtered_strings(
     max_length: Optional[int] = Query(None),
     word_count: Optional[int] = Query(None),
     contains_character: Optional[str] = Query(None, min_length=1, max_length=1),
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
     db: AsyncSession = Depends(get_db)
 ):
     strings, filters_applied = await crud.filter_strings(
@@ -159,24 +163,12 @@ async def get_filtered_strings(
         min_length,
         max_length,
         word_count,
-        contains_character
+        contains_character,
+        limit=limit,
+        offset=offset
     )
 
-    data = []
-    for s in strings:
-        data.append({
-            "id": s.id,
-            "value": s.value,
-            "properties": {
-                "length": s.length,
-                "is_palindrome": s.is_palindrome,
-                "unique_characters": s.unique_characters,
-                "word_count": s.word_count,
-                "sha256_hash": s.sha256_hash,
-                "character_frequency_map": s.character_frequency_map,
-            },
-            "created_at": s.created_at
-        })
+    data = [serialize_string_row(s) for s in strings]
 
     return {
         "data": data,
@@ -1,16 +1,34 @@
-from sqlalchemy import Column, String, Integer, Boolean, JSON, DateTime
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, Index, BigInteger
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from .database import Base
 
 class AnalyzedString(Base):
     __tablename__ = "strings"
+    __table_args__ = (
+        # Composite indexes matching the filter_strings predicate shapes:
+        # equality columns (is_palindrome, word_count) lead, the range
+        # column (length) comes last
+        Index("ix_strings_pal_len", "is_palindrome", "length"),
+        Index("ix_strings_pal_wc", "is_palindrome", "word_count"),
+    )
+    # Fetch server defaults (created_at) via RETURNING on the INSERT
+    # itself instead of a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(String, primary_key=True, index=True)  # sha256 hash
     value = Column(String, unique=True, nullable=False)
-    length = Column(Integer)
+    length = Column(Integer, index=True)
     is_palindrome = Column(Boolean)
     unique_characters = Column(Integer)
-    word_count = Column(Integer)
+    word_count = Column(Integer, index=True)
     sha256_hash = Column(String, unique=True)
-    character_frequency_map = Column(JSON)
+    # JSONB (binary) avoids re-parsing the text representation on
+    # every read, unlike the plain JSON type
+    character_frequency_map = Column(JSONB)
+    # 128-bit presence bitmap of the lowercased ASCII characters in value
+    # (bits 0-63 in lo, 64-127 in hi, stored as signed BIGINTs); lets the
+    # contains_character filter run as a bit test instead of ILIKE '%c%'
+    char_bitmap_lo = Column(BigInteger)
+    char_bitmap_hi = Column(BigInteger)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
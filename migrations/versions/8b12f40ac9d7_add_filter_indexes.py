@@ -0,0 +1,34 @@
+"""Add indexes for the filter_strings predicates
+
+Revision ID: 8b12f40ac9d7
+Revises: 363f4eefbd65
+Create Date: 2025-11-04 09:12:33.104582
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b12f40ac9d7'
+down_revision: Union[str, Sequence[str], None] = '363f4eefbd65'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_strings_length'), 'strings', ['length'], unique=False)
+    op.create_index(op.f('ix_strings_word_count'), 'strings', ['word_count'], unique=False)
+    op.create_index('ix_strings_pal_len', 'strings', ['is_palindrome', 'length'], unique=False)
+    op.create_index('ix_strings_pal_wc', 'strings', ['is_palindrome', 'word_count'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_strings_pal_wc', table_name='strings')
+    op.drop_index('ix_strings_pal_len', table_name='strings')
+    op.drop_index(op.f('ix_strings_word_count'), table_name='strings')
+    op.drop_index(op.f('ix_strings_length'), table_name='strings')
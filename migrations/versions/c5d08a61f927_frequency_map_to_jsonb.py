@@ -0,0 +1,37 @@
+"""Convert character_frequency_map to JSONB
+
+Revision ID: c5d08a61f927
+Revises: f3c91e7ba254
+Create Date: 2025-11-18 10:05:12.667204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d08a61f927'
+down_revision: Union[str, Sequence[str], None] = 'f3c91e7ba254'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        'strings', 'character_frequency_map',
+        type_=JSONB(),
+        postgresql_using='character_frequency_map::jsonb'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'strings', 'character_frequency_map',
+        type_=sa.JSON(),
+        postgresql_using='character_frequency_map::json'
+    )
@@ -0,0 +1,45 @@
+"""Add character-presence bitmap columns
+
+Revision ID: f3c91e7ba254
+Revises: 8b12f40ac9d7
+Create Date: 2025-11-11 14:27:45.918236
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c91e7ba254'
+down_revision: Union[str, Sequence[str], None] = '8b12f40ac9d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('strings', sa.Column('char_bitmap_lo', sa.BigInteger(), nullable=True))
+    op.add_column('strings', sa.Column('char_bitmap_hi', sa.BigInteger(), nullable=True))
+    # Backfill existing rows: OR together one bit per distinct lowercased
+    # ASCII character of value (bits 0-63 in lo, 64-127 in hi)
+    op.execute("""
+        UPDATE strings SET
+            char_bitmap_lo = (
+                SELECT COALESCE(bit_or(CASE WHEN ascii(c) < 64
+                    THEN 1::bigint << ascii(c) END), 0)
+                FROM unnest(string_to_array(lower(value), NULL)) AS c
+            ),
+            char_bitmap_hi = (
+                SELECT COALESCE(bit_or(CASE WHEN ascii(c) BETWEEN 64 AND 127
+                    THEN 1::bigint << (ascii(c) - 64) END), 0)
+                FROM unnest(string_to_array(lower(value), NULL)) AS c
+            )
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('strings', 'char_bitmap_hi')
+    op.drop_column('strings', 'char_bitmap_lo')